@@ -10,9 +10,20 @@ from .config import AzureBlobConfig
 @asynccontextmanager
 async def azure_blob_container_client(
     config: AzureBlobConfig,
+    client_override: ContainerClient | None = None,
 ) -> AsyncIterator[tuple[ContainerClient, str]]:
-    """Get the Azure Blob Container Client."""
+    """Get the Azure Blob Container Client.
+
+    Args:
+        config: The azure blob backend configuration.
+        client_override: An already opened container client to reuse instead
+            of creating a new one. It is not closed on exit.
+    """
     account_url, container_name, base_path = config.parse_destination_path()
+    if client_override is not None:
+        yield client_override, base_path
+        return
+
     if config.connection_string:
         async with ContainerClient.from_connection_string(
             conn_str=config.connection_string.get_secret_value(),
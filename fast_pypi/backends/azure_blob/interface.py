@@ -1,5 +1,7 @@
 import hashlib
 from collections.abc import Sequence
+from contextlib import AbstractAsyncContextManager
+from typing import TYPE_CHECKING
 
 from typing_extensions import override
 
@@ -15,16 +17,45 @@ from fast_pypi.logger import logger
 from .azure_blob_utils import azure_blob_container_client
 from .config import AzureBlobConfig
 
+if TYPE_CHECKING:
+    from azure.storage.blob.aio import ContainerClient
+
 
 class AzureBlobBackend(AbstractBackendInterface):
     """Interface for the azure blob backend."""
 
     config: AzureBlobConfig
+    _shared_container_client: 'ContainerClient | None'
 
-    def __init__(self, config: AzureBlobConfig, general_config: FastPypiConfig) -> None:
+    def __init__(
+        self,
+        config: AzureBlobConfig,
+        general_config: FastPypiConfig,
+        container_client: 'ContainerClient | None' = None,
+    ) -> None:
+        """Initialize the azure blob backend.
+
+        Args:
+            config: The azure blob backend configuration.
+            general_config: General FastPypi configuration.
+            container_client: An already opened container client that every operation reuses instead of
+                opening its own. The backend does not close it.
+        """
         self.config = config
+        self._shared_container_client = container_client
         super().__init__(general_config=general_config)
 
+    def _container_client(self) -> AbstractAsyncContextManager[tuple['ContainerClient', str]]:
+        """Get the container client and base path for one operation.
+
+        Returns:
+            A context manager yielding the container client and the base path.
+        """
+        return azure_blob_container_client(
+            config=self.config,
+            client_override=self._shared_container_client,
+        )
+
     @override
     async def list_projects(self) -> Sequence[str]:
         """List all projects in the azure blob backend.
@@ -32,7 +63,7 @@ class AzureBlobBackend(AbstractBackendInterface):
         Returns:
             A sequence of project names.
         """
-        async with azure_blob_container_client(config=self.config) as (container_client, base_path):
+        async with self._container_client() as (container_client, base_path):
             blob_props = [
                 blob_prop async for blob_prop in container_client.walk_blobs(name_starts_with=base_path, delimiter='/')
             ]
@@ -55,7 +86,7 @@ class AzureBlobBackend(AbstractBackendInterface):
         Returns:
             A sequence of version strings for the specified project.
         """
-        async with azure_blob_container_client(config=self.config) as (container_client, base_path):
+        async with self._container_client() as (container_client, base_path):
             name_prefix = f'{base_path}{project_name}/'
             blob_props = [
                 blob_prop
@@ -86,7 +117,7 @@ class AzureBlobBackend(AbstractBackendInterface):
         Returns:
             A sequence of ProjectFileInfo objects for the specified project.
         """
-        async with azure_blob_container_client(config=self.config) as (container_client, base_path):
+        async with self._container_client() as (container_client, base_path):
             name_prefix = f'{base_path}{project_name}/'
             blob_props = sorted(
                 [
@@ -128,7 +159,7 @@ class AzureBlobBackend(AbstractBackendInterface):
             A FileContents object containing the file's contents and SHA256
                 digest, or None if the file does not exist.
         """
-        async with azure_blob_container_client(config=self.config) as (container_client, base_path):
+        async with self._container_client() as (container_client, base_path):
             blob_name = f'{base_path}{project_name}/{version}/{filename}'
             blob_client = container_client.get_blob_client(blob_name)
 
@@ -184,7 +215,7 @@ class AzureBlobBackend(AbstractBackendInterface):
             file_content: The content of the file to save.
             sha256_digest: The SHA256 digest of the file content.
         """
-        async with azure_blob_container_client(config=self.config) as (container_client, base_path):
+        async with self._container_client() as (container_client, base_path):
             blob_name = f'{base_path}{project_name}/{version}/{filename}'
             blob_client = container_client.get_blob_client(blob_name)
 
@@ -223,7 +254,7 @@ class AzureBlobBackend(AbstractBackendInterface):
         Returns:
             True if the version was deleted, False if it did not exist.
         """
-        async with azure_blob_container_client(config=self.config) as (container_client, base_path):
+        async with self._container_client() as (container_client, base_path):
             blob_name_prefix = f'{base_path}{project_name}/{version}/'
 
             blob_props = [
@@ -271,7 +302,7 @@ class AzureBlobBackend(AbstractBackendInterface):
         Returns:
             True if the file was deleted, False if it did not exist.
         """
-        async with azure_blob_container_client(config=self.config) as (container_client, base_path):
+        async with self._container_client() as (container_client, base_path):
             blob_name = f'{base_path}{project_name}/{version}/{filename}'
             blob_client = container_client.get_blob_client(blob_name)
 
@@ -1,21 +1,74 @@
 import os
-from typing import Literal
+from collections.abc import Mapping
+from functools import lru_cache
+from types import MappingProxyType
+from typing import ClassVar, Literal
 
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
+
+# Accepted spellings of boolean environment values; anything else parses as False
+_BOOL_MAP: Mapping[str, bool] = MappingProxyType(
+    {
+        'true': True,
+        '1': True,
+        'yes': True,
+        'false': False,
+        '0': False,
+        'no': False,
+    }
+)
+
+
+def _parse_bool(value: str) -> bool:
+    """Parse a boolean environment value.
+
+    Args:
+        value: Raw environment value.
+
+    Returns:
+        bool: The parsed value, False if the value is not recognized.
+    """
+    return _BOOL_MAP.get(value.strip().lower(), False)
 
 
 class FastPypiConfig(BaseModel):
     """Configuration for the local file system storage environment."""
 
-    allow_overwrite: bool
-    backend: Literal['localfs', 'azure_blob']
+    # Frozen because from_env hands the same cached instance to every caller
+    model_config: ClassVar[ConfigDict] = ConfigDict(frozen=True)
+
+    allow_overwrite: bool = False
+    backend: Literal['localfs', 'azure_blob'] = 'localfs'
 
     @classmethod
     def from_env(cls) -> 'FastPypiConfig':
-        """Create a LocalFSConfig instance from environment variables."""
-        return FastPypiConfig.model_validate(
-            {
-                'allow_overwrite': os.getenv('FAST_PYPI_ALLOW_OVERWRITE', 'false').lower() == 'true',
-                'backend': os.getenv('FAST_PYPI_BACKEND', 'localfs'),
-            }
+        """Create a FastPypiConfig instance from environment variables.
+
+        Parsed configs are cached by the raw environment values, so repeated calls with an
+        unchanged environment return the same frozen instance.
+        """
+        return _config_from_env_values(
+            allow_overwrite=os.getenv('FAST_PYPI_ALLOW_OVERWRITE'),
+            backend=os.getenv('FAST_PYPI_BACKEND'),
         )
+
+
+@lru_cache(maxsize=8)
+def _config_from_env_values(allow_overwrite: str | None, backend: str | None) -> FastPypiConfig:
+    """Parse and validate a FastPypiConfig from raw environment values.
+
+    Unset variables are left out so the model's field defaults apply.
+
+    Args:
+        allow_overwrite: Raw value of FAST_PYPI_ALLOW_OVERWRITE, or None if unset.
+        backend: Raw value of FAST_PYPI_BACKEND, or None if unset.
+
+    Returns:
+        FastPypiConfig: The validated configuration.
+    """
+    values: dict[str, object] = {}
+    if allow_overwrite is not None:
+        values['allow_overwrite'] = _parse_bool(allow_overwrite)
+    if backend is not None:
+        values['backend'] = backend
+    return FastPypiConfig.model_validate(values)
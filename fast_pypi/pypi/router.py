@@ -1,3 +1,4 @@
+import asyncio
 import mimetypes
 from collections.abc import Sequence
 from pathlib import Path
@@ -6,6 +7,7 @@ from typing import Annotated, Literal
 from fastapi import (
     APIRouter,
     Body,
+    Depends,
     File,
     Form,
     HTTPException,
@@ -18,7 +20,7 @@ from fastapi.templating import Jinja2Templates
 from pydantic import BaseModel, Field
 from starlette.responses import HTMLResponse
 
-from fast_pypi.backends import ProjectFileExistsError
+from fast_pypi.backends import AbstractBackendInterface, ProjectFileExistsError
 from fast_pypi.get_backend import get_backend_from_env
 from fast_pypi.logger import logger
 
@@ -27,22 +29,37 @@ from .package_rbac import package_rbac_dependency
 templates = Jinja2Templates(
     directory=Path(__file__).parent / 'templates',
 )
+# The templates ship with the package and never change at runtime, so skip the per-render mtime check
+templates.env.auto_reload = False
 pep503_router = APIRouter()
 
 
+async def backend_dependency() -> AbstractBackendInterface:
+    """FastAPI dependency providing the storage backend configured in the environment.
+
+    Declared async so FastAPI resolves it on the event loop instead of dispatching it to the threadpool.
+
+    Returns:
+        AbstractBackendInterface: The configured storage backend.
+    """
+    return get_backend_from_env()
+
+
+BackendDep = Annotated[AbstractBackendInterface, Depends(backend_dependency)]
+
+
 @pep503_router.get(
     '/simple/',
     response_class=HTMLResponse,
     dependencies=[package_rbac_dependency('read')],
     include_in_schema=False,
 )
-async def get_simple_index(request: Request) -> HTMLResponse:
+async def get_simple_index(request: Request, backend: BackendDep) -> HTMLResponse:
     """A simple endpoint to test the router.
 
     Returns:
         HTMLResponse: A simple HTML response listing all projects.
     """
-    backend = get_backend_from_env()
     return templates.TemplateResponse(
         request=request,
         name='simple_index.html',
@@ -58,9 +75,8 @@ async def get_simple_index(request: Request) -> HTMLResponse:
     dependencies=[package_rbac_dependency('read')],
     include_in_schema=False,
 )
-async def get_project_simple_index(request: Request, project_name: str) -> HTMLResponse:
+async def get_project_simple_index(request: Request, project_name: str, backend: BackendDep) -> HTMLResponse:
     """A simple endpoint to test the router."""
-    backend = get_backend_from_env()
     project_files = await backend.list_files_for_project(
         project_name,
     )
@@ -87,9 +103,9 @@ async def get_project_artifact(
     project_name: str,
     version: str,
     filename: str,
+    backend: BackendDep,
 ) -> Response:
     """Get a specific artifact for a project."""
-    backend = get_backend_from_env()
     file_contents = await backend.get_file_contents(
         project_name=project_name,
         version=version,
@@ -138,10 +154,9 @@ class UploadFormData(BaseModel):
 )
 async def upload_project_file(
     body: Annotated[UploadFormData, Form(media_type='multipart/form-data')],
+    backend: BackendDep,
 ) -> None:
     """Upload a project file to the server."""
-    backend = get_backend_from_env()
-
     if not body.content.filename:  # pragma: no cover
         logger.warning(
             'upload_file_missing_filename',
@@ -182,9 +197,8 @@ async def upload_project_file(
     '/projects/',
     dependencies=[package_rbac_dependency('read')],
 )
-async def list_projects() -> Sequence[str]:
+async def list_projects(backend: BackendDep) -> Sequence[str]:
     """List all projects."""
-    backend = get_backend_from_env()
     return await backend.list_projects()
 
 
@@ -192,9 +206,8 @@ async def list_projects() -> Sequence[str]:
     '/projects/{project_name}/versions/',
     dependencies=[package_rbac_dependency('read')],
 )
-async def list_project_versions(project_name: str) -> Sequence[str]:
+async def list_project_versions(project_name: str, backend: BackendDep) -> Sequence[str]:
     """List all versions for a specific project."""
-    backend = get_backend_from_env()
     project_versions = await backend.list_project_versions(project_name)
     if not project_versions:
         raise HTTPException(
@@ -213,17 +226,26 @@ async def delete_project_versions(
     _: Request,
     project_name: str,
     versions: Annotated[list[str], Body()],
+    backend: BackendDep,
 ) -> Sequence[str]:
-    """Delete a specific version of a project."""
-    backend = get_backend_from_env()
-    deleted_versions: list[str] = []
-    for version in versions:
-        deleted = await backend.delete_project_version(
-            project_name=project_name,
-            version=version,
-        )
-        if deleted:
-            deleted_versions.append(version)
+    """Delete specific versions of a project.
+
+    Duplicate versions are collapsed before deleting. The deletes run concurrently, so if one of them
+    fails the request errors while the other versions may already have been deleted.
+    """
+    # Concurrent deletes of the same version would race each other, so drop duplicates first
+    versions = list(dict.fromkeys(versions))
+    # Issue the deletes concurrently; gather preserves the order of the requested versions
+    results = await asyncio.gather(
+        *[
+            backend.delete_project_version(
+                project_name=project_name,
+                version=version,
+            )
+            for version in versions
+        ]
+    )
+    deleted_versions = [version for version, deleted in zip(versions, results, strict=True) if deleted]
 
     logger.info(
         'project_versions_deleted',
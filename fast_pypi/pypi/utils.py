@@ -14,6 +14,14 @@ __ARTIFACTS_PATTERN = re.compile(r'.*/artifacts/([^/]+)/.+')
 __LIST_PROJECTS_PATTERN = re.compile(r'.*/projects/?$')
 __PACKAGE_INFO_PATTERN = re.compile(r'.*/projects/([^/]+)/.*')
 
+# Project-specific endpoints, tried in order, as (method, pattern) pairs
+__PROJECT_PATTERNS: tuple[tuple[str, Pattern[str]], ...] = (
+    ('GET', __SIMPLE_PROJECT_PATTERN),
+    ('GET', __ARTIFACTS_PATTERN),
+    ('GET', __PACKAGE_INFO_PATTERN),
+    ('POST', __PACKAGE_INFO_PATTERN),
+)
+
 
 def pypi_normalize(name: str) -> str:
     """Normalize a PyPI package name.
@@ -64,6 +72,38 @@ async def _get_project_name_from_upload_form(request: Request) -> str | None:
         return None
 
 
+def infer_project_name_from_path(method: str, path: str) -> str | None:
+    """Infer the project name from the request method and URL path alone.
+
+    Upload requests carry the project name in their form data and are not handled here.
+
+    Args:
+        method: The HTTP method of the request.
+        path: The URL path of the request.
+
+    Returns:
+        str | None: The inferred project name, or None if accessing a root index.
+
+    Raises:
+        ValueError: If the method and path do not match any of the expected patterns.
+    """
+    # Root simple index always returns None
+    if method == 'GET' and (__SIMPLE_ROOT_PATTERN.match(path) or __LIST_PROJECTS_PATTERN.match(path)):
+        return None
+
+    # Try project-specific endpoints in order
+    for pattern_method, pattern in __PROJECT_PATTERNS:
+        if method == pattern_method and (result := _get_project_name_from_path_pattern(pattern, path)) is not None:
+            return result
+
+    msg = (
+        f'Unable to infer project name from request: '
+        f'method={method}, path={path}. '
+        'Ensure the path matches one of the expected patterns.'
+    )
+    raise ValueError(msg)
+
+
 async def infer_project_name_from_request(request: Request) -> str | None:
     """Infer the project name from the request path or form data.
 
@@ -81,38 +121,8 @@ async def infer_project_name_from_request(request: Request) -> str | None:
     Returns:
         str | None: The inferred project name, or None if accessing root index or unable to infer.
     """
-    # Root simple index always returns None
-    if request.method == 'GET' and (
-        __SIMPLE_ROOT_PATTERN.match(request.url.path) or __LIST_PROJECTS_PATTERN.match(request.url.path)
-    ):
-        return None
-
     # Upload endpoint gets project name from form data
     if request.method == 'POST' and __UPLOAD_PATTERN.match(request.url.path):
         return await _get_project_name_from_upload_form(request)
 
-    # Try project-specific endpoints in order
-    for method, pattern in [
-        ('GET', __SIMPLE_PROJECT_PATTERN),
-        ('GET', __ARTIFACTS_PATTERN),
-        ('GET', __PACKAGE_INFO_PATTERN),
-        ('POST', __PACKAGE_INFO_PATTERN),
-    ]:
-        if (
-            request.method == method
-            and (
-                result := _get_project_name_from_path_pattern(
-                    pattern,
-                    request.url.path,
-                )
-            )
-            is not None
-        ):
-            return result
-
-    msg = (
-        f'Unable to infer project name from request: '
-        f'method={request.method}, path={request.url.path}. '
-        'Ensure the path matches one of the expected patterns.'
-    )
-    raise ValueError(msg)
+    return infer_project_name_from_path(request.method, request.url.path)
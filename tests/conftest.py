@@ -0,0 +1,27 @@
+import pytest
+
+
+def pytest_addoption(parser: pytest.Parser) -> None:
+    """Register the --slow option to opt in to slow tests."""
+    parser.addoption(
+        '--slow',
+        action='store_true',
+        default=False,
+        help='Run tests marked as slow (e.g. tests requiring an Azurite container).',
+    )
+
+
+def pytest_configure(config: pytest.Config) -> None:
+    """Register the slow marker."""
+    config.addinivalue_line('markers', 'slow: marks tests as slow (run with --slow)')
+
+
+def pytest_collection_modifyitems(config: pytest.Config, items: list[pytest.Item]) -> None:
+    """Skip tests marked as slow unless --slow was passed."""
+    if config.getoption('--slow'):
+        return
+
+    skip_slow = pytest.mark.skip(reason='use --slow to run')
+    for item in items:
+        if 'slow' in item.keywords:
+            item.add_marker(skip_slow)
@@ -29,6 +29,9 @@ declare -a versions=(
     "other-package 0.1.0"
 )
 
+# Find GNU sed once for rendering every package template
+SED=$(find_sed) || exit 1
+
 # For each version, create, build and publish the package
 for version in "${versions[@]}"; do
     read -r pkg_name pkg_version <<< "$version"
@@ -37,10 +40,11 @@ for version in "${versions[@]}"; do
     pkg_dir="$TEST_DIR/$pkg_name-$pkg_version"
     cp -r "tests/e2e/publishable_templates/example_package_poetry" "$pkg_dir"
     
-    # Find GNU sed and replace template variables
-    SED=$(find_sed) || exit 1
-    "$SED" -i "s/{{package_name}}/$pkg_name/g" "$pkg_dir/pyproject.toml"
-    "$SED" -i "s/{{package_version}}/$pkg_version/g" "$pkg_dir/pyproject.toml"
+    # Replace template variables
+    "$SED" -i \
+        -e "s/{{package_name}}/$pkg_name/g" \
+        -e "s/{{package_version}}/$pkg_version/g" \
+        "$pkg_dir/pyproject.toml"
     "$SED" -i "s/{{package_version}}/$pkg_version/g" "$pkg_dir/src/version.py"
 
     # Build the package
@@ -60,6 +64,9 @@ for version in "${versions[@]}"; do
         export POETRY_HTTP_BASIC_FASTPYPIUPLOAD_PASSWORD=dog
         poetry publish --repository fastpypiupload
     )
+
+    # Free the build tree before the next package; the EXIT trap handles failures
+    rm -rf "$pkg_dir"
 done
 
 # Verify the published versions
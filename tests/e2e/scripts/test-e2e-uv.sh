@@ -27,6 +27,9 @@ declare -a versions=(
     "other-package 0.1.0"
 )
 
+# Find GNU sed once for rendering every package template
+SED=$(find_sed) || exit 1
+
 # For each version, create, build and publish the package
 for version in "${versions[@]}"; do
     read -r pkg_name pkg_version <<< "$version"
@@ -35,8 +38,7 @@ for version in "${versions[@]}"; do
     pkg_dir="$TEST_DIR/$pkg_name-$pkg_version"
     cp -r "tests/e2e/publishable_templates/example_package_uv" "$pkg_dir"
     
-    # Find GNU sed and replace template variables
-    SED=$(find_sed) || exit 1
+    # Replace template variables
     "$SED" -i "s/{{package_name}}/$pkg_name/g" "$pkg_dir/pyproject.toml"
     "$SED" -i "s/{{package_version}}/$pkg_version/g" "$pkg_dir/src/version.py"
 
@@ -48,6 +50,9 @@ for version in "${versions[@]}"; do
         --username hot \
         --password dog \
         "$pkg_dir/dist/*"
+
+    # Free the build tree before the next package; the EXIT trap handles failures
+    rm -rf "$pkg_dir"
 done
 
 # Verify the published versions
@@ -62,7 +67,7 @@ if ! command -v jq >/dev/null 2>&1; then
 fi
 
 # Check if we got all versions using jq
-published_versions=$(echo "$versions_json" | jq -r '.versions[]')
+published_versions=$(jq -r '.versions[]' <<< "$versions_json")
 expected_versions=("0.1.0" "0.2.0" "0.2.0a1")
 
 for version in "${expected_versions[@]}"; do
@@ -96,7 +101,7 @@ mkdir -p "$project_dir"
         exit 1
     fi
 
-    installed_version=$(echo "$installed_json" | jq -r '.[] | select(.name=="example-package") | .version')
+    installed_version=$(jq -r '.[] | select(.name=="example-package") | .version' <<< "$installed_json")
     
     if [ "$installed_version" != "0.2.0" ]; then
         echo "Package not installed correctly. Found version: ${installed_version:-not found}"
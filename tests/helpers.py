@@ -1,5 +1,21 @@
 import hashlib
-from dataclasses import dataclass
+from collections import defaultdict
+from collections.abc import Sequence
+from dataclasses import dataclass, field
+from functools import cache, cached_property
+
+from typing_extensions import override
+
+from fast_pypi.backends import AbstractBackendInterface, FileContents
+from fast_pypi.backends.interface import ProjectFileInfo
+from fast_pypi.config import FastPypiConfig
+from fast_pypi.pypi.package_rbac import ProjectRBACDecisionInput
+
+
+@cache
+def _sha256_hexdigest(content: bytes) -> str:
+    """Calculate the SHA256 hex digest of content, once per distinct payload."""
+    return hashlib.sha256(content).hexdigest()
 
 
 @dataclass
@@ -10,12 +26,102 @@ class UploadTestFile:
     version: str
     content: bytes
 
-    @property
+    @cached_property
     def wheel_filename(self) -> str:
         """Generate the wheel filename based on project name and version."""
         return f'{self.project_name}-{self.version}-py3-none-any.whl'
 
-    @property
+    @cached_property
     def sha256_digest(self) -> str:
         """Calculate the SHA256 digest of the file content."""
-        return hashlib.sha256(self.content).hexdigest()
+        return _sha256_hexdigest(self.content)
+
+
+@dataclass
+class RBACRecorder:
+    """Async stand-in for the RBAC check that records every input it is awaited with."""
+
+    calls: list[ProjectRBACDecisionInput] = field(default_factory=list)
+
+    async def __call__(self, *, rbac_input: ProjectRBACDecisionInput) -> None:
+        """Record the RBAC input and allow the request."""
+        self.calls.append(rbac_input)
+
+
+class StubBackend(AbstractBackendInterface):
+    """Backend stand-in that returns preset results and records the arguments of every call.
+
+    Attributes:
+        projects: Result of list_projects.
+        project_versions: Result of list_project_versions.
+        project_files: Result of list_files_for_project.
+        file_contents: Result of get_file_contents.
+        upload_error: Exception raised by upload_file, if set.
+        deleted_versions: Versions delete_project_version reports as deleted.
+        calls: Arguments of every call, keyed by method name.
+    """
+
+    def __init__(self) -> None:
+        super().__init__(general_config=FastPypiConfig())
+        self.projects: Sequence[str] = []
+        self.project_versions: Sequence[str] = []
+        self.project_files: Sequence[ProjectFileInfo] = []
+        self.file_contents: FileContents | None = None
+        self.upload_error: Exception | None = None
+        self.deleted_versions: set[str] = set()
+        self.calls: defaultdict[str, list[dict[str, object]]] = defaultdict(list)
+
+    @override
+    async def list_projects(self) -> Sequence[str]:
+        self.calls['list_projects'].append({})
+        return self.projects
+
+    @override
+    async def list_project_versions(self, project_name: str) -> Sequence[str]:
+        self.calls['list_project_versions'].append({'project_name': project_name})
+        return self.project_versions
+
+    @override
+    async def list_files_for_project(self, project_name: str) -> Sequence[ProjectFileInfo]:
+        self.calls['list_files_for_project'].append({'project_name': project_name})
+        return self.project_files
+
+    @override
+    async def get_file_contents(self, project_name: str, version: str, filename: str) -> FileContents | None:
+        self.calls['get_file_contents'].append(
+            {'project_name': project_name, 'version': version, 'filename': filename}
+        )
+        return self.file_contents
+
+    @override
+    async def upload_file(
+        self,
+        project_name: str,
+        version: str,
+        filename: str,
+        file_content: bytes,
+        sha256_digest: str | None,
+    ) -> None:
+        self.calls['upload_file'].append(
+            {
+                'project_name': project_name,
+                'version': version,
+                'filename': filename,
+                'file_content': file_content,
+                'sha256_digest': sha256_digest,
+            }
+        )
+        if self.upload_error is not None:
+            raise self.upload_error
+
+    @override
+    async def delete_project_version(self, project_name: str, version: str) -> bool:
+        self.calls['delete_project_version'].append({'project_name': project_name, 'version': version})
+        return version in self.deleted_versions
+
+    @override
+    async def delete_project_version_file(self, project_name: str, version: str, filename: str) -> bool:
+        self.calls['delete_project_version_file'].append(
+            {'project_name': project_name, 'version': version, 'filename': filename}
+        )
+        return False
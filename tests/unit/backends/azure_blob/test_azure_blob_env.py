@@ -1,3 +1,4 @@
+import os
 from dataclasses import dataclass
 
 import pytest
@@ -5,6 +6,8 @@ from pydantic import SecretStr
 
 from fast_pypi.backends.azure_blob.config import AzureBlobConfig
 
+DESTINATION_PATH = 'https://account.blob.core.windows.net/container/path/'
+
 
 @dataclass
 class AzureBlobConfigFromEnvTestCase:
@@ -17,14 +20,14 @@ class AzureBlobConfigFromEnvTestCase:
     [
         AzureBlobConfigFromEnvTestCase(
             env={
-                'FAST_PYPI_AZURE_BLOB_DESTINATION_PATH': 'https://account.blob.core.windows.net/container/path/',
+                'FAST_PYPI_AZURE_BLOB_DESTINATION_PATH': DESTINATION_PATH,
                 'FAST_PYPI_AZURE_BLOB_CONNECTION_STRING': (
                     'DefaultEndpointsProtocol=https;AccountName=devstoreaccount1;'
                 ),
                 'FAST_PYPI_AZURE_BLOB_CONNECTION_METHOD': 'default',
             },
             expected=AzureBlobConfig(
-                destination_path='https://account.blob.core.windows.net/container/path/',
+                destination_path=DESTINATION_PATH,
                 connection_string=SecretStr('DefaultEndpointsProtocol=https;AccountName=devstoreaccount1;'),
                 connection_method='default',
             ),
@@ -43,35 +46,24 @@ class AzureBlobConfigFromEnvTestCase:
         # Test with default connection_method
         AzureBlobConfigFromEnvTestCase(
             env={
-                'FAST_PYPI_AZURE_BLOB_DESTINATION_PATH': 'https://account.blob.core.windows.net/container/path/',
+                'FAST_PYPI_AZURE_BLOB_DESTINATION_PATH': DESTINATION_PATH,
             },
             expected=AzureBlobConfig(
-                destination_path='https://account.blob.core.windows.net/container/path/',
+                destination_path=DESTINATION_PATH,
                 connection_string=None,
                 connection_method='default',
             ),
         ),
     ],
 )
-def test_azure_blob_config_from_env(test_case: AzureBlobConfigFromEnvTestCase, monkeypatch: pytest.MonkeyPatch):
+def test_azure_blob_config_from_env(test_case: AzureBlobConfigFromEnvTestCase):
     """Test AzureBlobConfig.from_env with various environment configurations.
 
     Args:
         test_case: The test case containing environment variables and expected config
-        monkeypatch: pytest fixture for modifying environment variables
     """
-    # Set up environment variables
-    for key, value in test_case.env.items():
-        monkeypatch.setenv(key, value)
-
-    # Clear any variables not in test case
-    for key in [
-        'FAST_PYPI_AZURE_BLOB_DESTINATION_PATH',
-        'FAST_PYPI_AZURE_BLOB_CONNECTION_STRING',
-        'FAST_PYPI_AZURE_BLOB_CONNECTION_METHOD',
-    ]:
-        if key not in test_case.env:
-            monkeypatch.delenv(key, raising=False)
+    # Set up environment variables; the autouse fixture clears and restores the FAST_PYPI_* keys
+    os.environ.update(test_case.env)
 
     # Create config from environment
     config = AzureBlobConfig.from_env()
@@ -7,7 +7,8 @@ from testcontainers.azurite import AzuriteContainer  # pyright: ignore[reportMis
 from fast_pypi.backends.azure_blob.interface import AzureBlobBackend
 
 
-@pytest.mark.asyncio
+@pytest.mark.slow
+@pytest.mark.xdist_group('azurite')
 async def test_azure_blob_get_file_contents_missing_sha256(
     azurite_container: AzuriteContainer,
     azure_blob_backend: AzureBlobBackend,
@@ -35,14 +36,21 @@ async def test_azure_blob_get_file_contents_missing_sha256(
             metadata={},  # Explicitly empty metadata
         )
 
+        # Reuse the open client for both backend roundtrips
+        backend = AzureBlobBackend(
+            config=azure_blob_backend.config,
+            general_config=azure_blob_backend.general_config,
+            container_client=container_client,
+        )
+
         # First get_file_contents should compute and store SHA256
-        fc1 = await azure_blob_backend.get_file_contents(project, version, filename)
+        fc1 = await backend.get_file_contents(project, version, filename)
         assert fc1 is not None
         assert fc1.content == content
         assert fc1.sha256_digest == expected_sha256
 
         # Second get_file_contents should find stored SHA256
-        fc2 = await azure_blob_backend.get_file_contents(project, version, filename)
+        fc2 = await backend.get_file_contents(project, version, filename)
         assert fc2 is not None
         assert fc2.content == content
         assert fc2.sha256_digest == expected_sha256
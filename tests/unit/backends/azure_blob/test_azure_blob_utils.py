@@ -9,14 +9,15 @@ from fast_pypi.backends.azure_blob.azure_blob_utils import (
 )
 from fast_pypi.backends.azure_blob.config import AzureBlobConfig
 
+DESTINATION_PATH = 'https://hotdogcart.blob.core.windows.net/hotdogcontainer/path/to/storage/'
+
 
-@pytest.mark.asyncio
 async def test_azure_blob_container_client_connection_string(
     mocker: MockerFixture,
 ):
     # Arrange
     config = AzureBlobConfig(
-        destination_path='https://hotdogcart.blob.core.windows.net/hotdogcontainer/path/to/storage/',
+        destination_path=DESTINATION_PATH,
         connection_string=SecretStr('this-is-a-connection-string'),
     )
 
@@ -39,7 +40,6 @@ async def test_azure_blob_container_client_connection_string(
         assert base_path == 'path/to/storage/'
 
 
-@pytest.mark.asyncio
 @pytest.mark.parametrize('connection_method', ['default', 'managed_identity'])
 async def test_azure_blob_container_client_credential(
     connection_method: Literal['default', 'managed_identity'],
@@ -47,7 +47,7 @@ async def test_azure_blob_container_client_credential(
 ):
     # Arrange
     config = AzureBlobConfig(
-        destination_path='https://hotdogcart.blob.core.windows.net/hotdogcontainer/path/to/storage/',
+        destination_path=DESTINATION_PATH,
         connection_method=connection_method,
     )
 
@@ -75,3 +75,33 @@ async def test_azure_blob_container_client_credential(
         credential_aenter_mock.assert_called_once()
         assert container_client == container_client_aenter_mock.return_value
         assert base_path == 'path/to/storage/'
+
+
+async def test_azure_blob_container_client_override(
+    mocker: MockerFixture,
+):
+    # Arrange
+    config = AzureBlobConfig(
+        destination_path=DESTINATION_PATH,
+        connection_string=SecretStr('this-is-a-connection-string'),
+    )
+    client_override = mocker.MagicMock()
+
+    from_conn_str_mock = mocker.patch(
+        'azure.storage.blob.aio.ContainerClient.from_connection_string',
+    )
+
+    # Act
+    async with azure_blob_container_client(
+        config=config,
+        client_override=client_override,
+    ) as (
+        container_client,
+        base_path,
+    ):
+        # Assert
+        from_conn_str_mock.assert_not_called()
+        assert container_client is client_override
+        assert base_path == 'path/to/storage/'
+
+    client_override.__aexit__.assert_not_called()
@@ -8,6 +8,7 @@ from azure.storage.blob import ContainerClient
 from pydantic import SecretStr
 from testcontainers.azurite import AzuriteContainer  # pyright: ignore[reportMissingTypeStubs]
 
+from fast_pypi.backends import AbstractBackendInterface
 from fast_pypi.backends.azure_blob.config import AzureBlobConfig
 from fast_pypi.backends.azure_blob.interface import AzureBlobBackend
 from fast_pypi.backends.localfs.config import LocalFSConfig
@@ -40,13 +41,38 @@ def azurite_container() -> Iterator[AzuriteContainer]:
         yield azurite
 
 
+@pytest.fixture(scope='class')
+def azure_blob_container(
+    azurite_container: AzuriteContainer,
+) -> Iterator[str]:
+    """Fixture to create a blob container shared by all tests in a class.
+
+    Deleting the container on teardown removes every blob the tests wrote.
+    """
+    container_name = 'blobtest' + secrets.token_hex(2)
+    container_client = ContainerClient.from_connection_string(
+        conn_str=azurite_container.get_connection_string(),
+        container_name=container_name,
+    )
+
+    _ = container_client.create_container()
+
+    yield container_name
+
+    _ = container_client.delete_container()
+
+
 @pytest.fixture
 def azure_blob_backend(
     azurite_container: AzuriteContainer,
-) -> Iterator[AzureBlobBackend]:
-    """Fixture to set up a azure blob backend for testing."""
-    container_name = 'blobtest' + secrets.token_hex(2)
-    base_path = '/fast_pypi/azureblob_tests/'
+    azure_blob_container: str,
+) -> AzureBlobBackend:
+    """Fixture to set up a azure blob backend for testing.
+
+    Each test gets its own base path inside the shared container so that
+    tests remain isolated from each other.
+    """
+    base_path = f'/fast_pypi/azureblob_tests/{secrets.token_hex(4)}/'
 
     azurite_host = azurite_container.get_container_host_ip()
     azurite_blob_port = azurite_container.get_exposed_port(10000)
@@ -54,14 +80,9 @@ def azure_blob_backend(
 
     azurite_url = f'http://{azurite_host}:{azurite_blob_port}'
 
-    _ = ContainerClient.from_connection_string(
-        conn_str=azurite_connection_string,
-        container_name=container_name,
-    ).create_container()
-
-    azure_blob_backend = AzureBlobBackend(
+    return AzureBlobBackend(
         config=AzureBlobConfig(
-            destination_path=f'{azurite_url}/{container_name}{base_path}',
+            destination_path=f'{azurite_url}/{azure_blob_container}{base_path}',
             connection_string=SecretStr(azurite_connection_string),
         ),
         general_config=FastPypiConfig(
@@ -70,9 +91,8 @@ def azure_blob_backend(
         ),
     )
 
-    yield azure_blob_backend
 
-    _ = ContainerClient.from_connection_string(
-        conn_str=azurite_connection_string,
-        container_name=container_name,
-    ).delete_container()
+@pytest.fixture
+def backend(request: pytest.FixtureRequest) -> AbstractBackendInterface:
+    """Fixture resolving the backend fixture named by an indirect parametrization."""
+    return request.getfixturevalue(request.param)
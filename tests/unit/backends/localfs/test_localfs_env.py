@@ -1,3 +1,4 @@
+import os
 from dataclasses import dataclass
 from pathlib import Path
 
@@ -25,23 +26,14 @@ class LocalFSConfigFromEnvTestCase:
         ),
     ],
 )
-def test_localfs_config_from_env(test_case: LocalFSConfigFromEnvTestCase, monkeypatch: pytest.MonkeyPatch):
+def test_localfs_config_from_env(test_case: LocalFSConfigFromEnvTestCase):
     """Test LocalFSConfig.from_env with environment configuration.
 
     Args:
         test_case: The test case containing environment variables and expected config
-        monkeypatch: pytest fixture for modifying environment variables
     """
-    # Set up environment variables
-    for key, value in test_case.env.items():
-        monkeypatch.setenv(key, value)
-
-    # Clear any variables not in test case
-    for key in [
-        'FAST_PYPI_LOCALFS_ROOT_PATH',
-    ]:
-        if key not in test_case.env:
-            monkeypatch.delenv(key, raising=False)
+    # Set up environment variables; the autouse fixture clears and restores the FAST_PYPI_* keys
+    os.environ.update(test_case.env)
 
     # Create config from environment
     config = LocalFSConfig.from_env()
@@ -1,12 +1,10 @@
 import hashlib
 
 import aiofiles
-import pytest
 
 from fast_pypi.backends.localfs.interface import LocalFSBackend
 
 
-@pytest.mark.asyncio
 async def test_localfs_get_file_contents_missing_sha256(
     localfs_backend: LocalFSBackend,
 ):
@@ -47,7 +45,6 @@ async def test_localfs_get_file_contents_missing_sha256(
         assert stored_sha256 == expected_sha256
 
 
-@pytest.mark.asyncio
 async def test_list_files_for_project_os_error(localfs_backend: LocalFSBackend):
     """Test list_files_for_project handles OS errors gracefully."""
     # Create a project directory
@@ -1,4 +1,5 @@
-from typing import TYPE_CHECKING, cast
+import asyncio
+from typing import TYPE_CHECKING
 
 import pytest
 
@@ -10,33 +11,25 @@ if TYPE_CHECKING:
 
 
 @pytest.mark.parametrize(
-    'backend_fixture',
+    'backend',
     [
         'localfs_backend',
-        'azure_blob_backend',
+        pytest.param('azure_blob_backend', marks=[pytest.mark.slow, pytest.mark.xdist_group('azurite')]),
     ],
+    indirect=True,
 )
 class TestBackendE2E:
     """Test class for PyPI backend implementations."""
 
-    @pytest.mark.asyncio
     async def test_backend_e2e(
         self,
-        backend_fixture: str,
-        request: pytest.FixtureRequest,
+        backend: 'AbstractBackendInterface',
     ) -> None:
         """Test the complete upload/list/download workflow for a backend.
 
         Args:
-            backend_fixture: Name of the backend fixture to use
-            request: The pytest request object
+            backend: The backend under test
         """
-        # Get the backend fixture
-        backend = cast(
-            'AbstractBackendInterface',
-            request.getfixturevalue(backend_fixture),
-        )
-
         upload_files = [
             UploadTestFile(
                 project_name='testproj',
@@ -55,15 +48,19 @@ class TestBackendE2E:
             ),
         ]
 
-        # Upload the files
-        for upload_file in upload_files:
-            await backend.upload_file(
-                project_name=upload_file.project_name,
-                version=upload_file.version,
-                filename=upload_file.wheel_filename,
-                file_content=upload_file.content,
-                sha256_digest=upload_file.sha256_digest,
-            )
+        # Upload the files concurrently
+        _ = await asyncio.gather(
+            *[
+                backend.upload_file(
+                    project_name=upload_file.project_name,
+                    version=upload_file.version,
+                    filename=upload_file.wheel_filename,
+                    file_content=upload_file.content,
+                    sha256_digest=upload_file.sha256_digest,
+                )
+                for upload_file in upload_files
+            ]
+        )
 
         # List projects
         projects = await backend.list_projects()
@@ -98,66 +95,39 @@ class TestBackendE2E:
         assert fc.content == upload_files[0].content
         assert fc.sha256_digest == upload_files[0].sha256_digest
 
-    @pytest.mark.asyncio
     async def test_backend_list_files_nonexistent_project(
         self,
-        backend_fixture: str,
-        request: pytest.FixtureRequest,
+        backend: 'AbstractBackendInterface',
     ) -> None:
         """Test listing files for a project that does not exist in the backend.
 
         Args:
-            backend_fixture: Name of the backend fixture to use
-            request: The pytest request object
+            backend: The backend under test
         """
-        # Get the backend fixture
-        backend = cast(
-            'AbstractBackendInterface',
-            request.getfixturevalue(backend_fixture),
-        )
-
         # Attempt to list files for a nonexistent project
         assert not await backend.list_files_for_project('nonexistentproj')
 
-    @pytest.mark.asyncio
     async def test_backend_get_versions_nonexistent_project(
         self,
-        backend_fixture: str,
-        request: pytest.FixtureRequest,
+        backend: 'AbstractBackendInterface',
     ) -> None:
         """Test getting versions for a project that does not exist in the backend.
 
         Args:
-            backend_fixture: Name of the backend fixture to use
-            request: The pytest request object
+            backend: The backend under test
         """
-        # Get the backend fixture
-        backend = cast(
-            'AbstractBackendInterface',
-            request.getfixturevalue(backend_fixture),
-        )
-
         # Attempt to get versions for a nonexistent project
         assert not await backend.list_project_versions('nonexistentproj')
 
-    @pytest.mark.asyncio
     async def test_backend_get_nonexistent_file(
         self,
-        backend_fixture: str,
-        request: pytest.FixtureRequest,
+        backend: 'AbstractBackendInterface',
     ) -> None:
         """Test getting a file that does not exist in the backend.
 
         Args:
-            backend_fixture: Name of the backend fixture to use
-            request: The pytest request object
+            backend: The backend under test
         """
-        # Get the backend fixture
-        backend = cast(
-            'AbstractBackendInterface',
-            request.getfixturevalue(backend_fixture),
-        )
-
         # Attempt to get a file that does not exist
         fc = await backend.get_file_contents(
             project_name='nonexistentproj',
@@ -166,12 +136,10 @@ class TestBackendE2E:
         )
         assert fc is None
 
-    @pytest.mark.asyncio
     @pytest.mark.parametrize('allow_overwrite', [True, False])
     async def test_backend_upload_existing_file(
         self,
-        backend_fixture: str,
-        request: pytest.FixtureRequest,
+        backend: 'AbstractBackendInterface',
         *,
         allow_overwrite: bool,
     ) -> None:
@@ -181,17 +149,10 @@ class TestBackendE2E:
         If allow_overwrite is False, a ProjectFileExistsError should be raised.
 
         Args:
-            backend_fixture: Name of the backend fixture to use
-            request: The pytest request object
+            backend: The backend under test
             allow_overwrite: Whether to allow overwriting existing files
         """
-        # Get the backend fixture
-        backend = cast(
-            'AbstractBackendInterface',
-            request.getfixturevalue(backend_fixture),
-        )
-
-        backend.general_config.allow_overwrite = allow_overwrite
+        backend.general_config = backend.general_config.model_copy(update={'allow_overwrite': allow_overwrite})
 
         upload_file = UploadTestFile(
             project_name='testproj',
@@ -237,24 +198,15 @@ class TestBackendE2E:
                     sha256_digest=upload_file.sha256_digest,
                 )
 
-    @pytest.mark.asyncio
     async def test_backend_delete_project_version(
         self,
-        backend_fixture: str,
-        request: pytest.FixtureRequest,
+        backend: 'AbstractBackendInterface',
     ) -> None:
         """Test deleting a project version from the backend.
 
         Args:
-            backend_fixture: Name of the backend fixture to use
-            request: The pytest request object
+            backend: The backend under test
         """
-        # Get the backend fixture
-        backend = cast(
-            'AbstractBackendInterface',
-            request.getfixturevalue(backend_fixture),
-        )
-
         upload_file = UploadTestFile(
             project_name='testproj',
             version='0.1.0',
@@ -304,24 +256,15 @@ class TestBackendE2E:
             is False
         )
 
-    @pytest.mark.asyncio
     async def test_backend_delete_project_version_file(
         self,
-        backend_fixture: str,
-        request: pytest.FixtureRequest,
+        backend: 'AbstractBackendInterface',
     ) -> None:
         """Test deleting a specific file from a project version in the backend.
 
         Args:
-            backend_fixture: Name of the backend fixture to use
-            request: The pytest request object
+            backend: The backend under test
         """
-        # Get the backend fixture
-        backend = cast(
-            'AbstractBackendInterface',
-            request.getfixturevalue(backend_fixture),
-        )
-
         upload_file = UploadTestFile(
             project_name='testproj',
             version='0.1.0',
@@ -373,24 +316,15 @@ class TestBackendE2E:
             is False
         )
 
-    @pytest.mark.asyncio
     async def test_backend_handle_missing_sha256(
         self,
-        backend_fixture: str,
-        request: pytest.FixtureRequest,
+        backend: 'AbstractBackendInterface',
     ) -> None:
         """Test handling of missing SHA256 digest file in the backend.
 
         Args:
-            backend_fixture: Name of the backend fixture to use
-            request: The pytest request object
+            backend: The backend under test
         """
-        # Get the backend fixture
-        backend = cast(
-            'AbstractBackendInterface',
-            request.getfixturevalue(backend_fixture),
-        )
-
         upload_file = UploadTestFile(
             project_name='testproj',
             version='0.1.0',
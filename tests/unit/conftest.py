@@ -0,0 +1,23 @@
+import os
+from collections.abc import Iterator
+
+import pytest
+
+_ENV_PREFIX = 'FAST_PYPI_'
+
+
+@pytest.fixture(autouse=True)
+def clean_fast_pypi_env() -> Iterator[None]:
+    """Fixture to run each test without FAST_PYPI_* variables, restoring them afterwards.
+
+    Only the FAST_PYPI_* keys are saved and restored, so tests may assign them on os.environ directly.
+    """
+    saved = {key: value for key, value in os.environ.items() if key.startswith(_ENV_PREFIX)}
+    for key in saved:
+        del os.environ[key]
+
+    yield
+
+    for key in [key for key in os.environ if key.startswith(_ENV_PREFIX)]:
+        del os.environ[key]
+    os.environ.update(saved)
@@ -1,14 +1,16 @@
-from unittest.mock import AsyncMock
+from collections.abc import AsyncIterator, Iterator
 
+import httpx
 import pytest
+import pytest_asyncio
 from fastapi import FastAPI
-from fastapi.testclient import TestClient
-from pytest_mock import MockerFixture
 
 from fast_pypi import pep503_router
+from fast_pypi.pypi.router import backend_dependency
+from tests.helpers import RBACRecorder, StubBackend
 
 
-@pytest.fixture
+@pytest.fixture(scope='session')
 def fast_pypi_test_app() -> FastAPI:
     """Fixture to create a FastAPI app with the pep503 router for testing."""
     app = FastAPI()
@@ -16,13 +18,31 @@ def fast_pypi_test_app() -> FastAPI:
     return app
 
 
+@pytest_asyncio.fixture(scope='session')
+async def async_client(fast_pypi_test_app: FastAPI) -> AsyncIterator[httpx.AsyncClient]:
+    """Fixture to create an async client calling the FastAPI app in-process."""
+    async with httpx.AsyncClient(
+        transport=httpx.ASGITransport(app=fast_pypi_test_app),
+        base_url='http://testserver',
+    ) as client:
+        yield client
+
+
 @pytest.fixture
-def fast_pypi_testclient(fast_pypi_test_app: FastAPI) -> TestClient:
-    """Fixture to create a TestClient for the FastAPI app."""
-    return TestClient(fast_pypi_test_app)
+def check_rbac_mock(monkeypatch: pytest.MonkeyPatch) -> RBACRecorder:
+    """Fixture to replace the RBAC check function with a recorder."""
+    recorder = RBACRecorder()
+    monkeypatch.setattr('fast_pypi.pypi.package_rbac.check_and_raise_project_rbac', recorder)
+    return recorder
 
 
 @pytest.fixture
-def check_rbac_mock(mocker: MockerFixture) -> AsyncMock:
-    """Fixture to mock the RBAC check function."""
-    return mocker.patch('fast_pypi.pypi.package_rbac.check_and_raise_project_rbac')
+def backend_stub(fast_pypi_test_app: FastAPI) -> Iterator[StubBackend]:
+    """Fixture to replace the backend used by the router with a stub.
+
+    The stub is injected through the app's dependency overrides, which are cleared again after the test.
+    """
+    backend = StubBackend()
+    fast_pypi_test_app.dependency_overrides[backend_dependency] = lambda: backend
+    yield backend
+    _ = fast_pypi_test_app.dependency_overrides.pop(backend_dependency, None)
@@ -0,0 +1,12 @@
+import os
+from pathlib import Path
+
+from fast_pypi.backends.localfs.interface import LocalFSBackend
+from fast_pypi.pypi.router import backend_dependency
+
+
+async def test_backend_dependency_resolves_env_backend(tmp_path: Path) -> None:
+    """Test that the router's backend dependency resolves the backend from the environment."""
+    os.environ['FAST_PYPI_LOCALFS_ROOT_PATH'] = str(tmp_path)
+    backend = await backend_dependency()
+    assert isinstance(backend, LocalFSBackend)
@@ -1,68 +1,75 @@
-from unittest.mock import AsyncMock
+from dataclasses import dataclass
 
+import httpx
+import pytest
 from fastapi import status
-from fastapi.testclient import TestClient
 from pytest_mock import MockerFixture
 
 from fast_pypi.pypi.package_rbac import ProjectRBACDecisionInput
+from tests.helpers import RBACRecorder, StubBackend
 
 
-def test_delete_project_version(
-    fast_pypi_testclient: TestClient,
-    check_rbac_mock: AsyncMock,
-    mocker: MockerFixture,
-) -> None:
-    """Test deleting a project version."""
-    # Mock the backend to return success
-    mock_backend = mocker.patch('fast_pypi.pypi.router.get_backend_from_env')
-    mock_delete = mock_backend.return_value.delete_project_version = mocker.AsyncMock()
-    mock_delete.side_effect = [True, False, True]
-
-    response = fast_pypi_testclient.post(
-        '/fast-pypi/projects/testproj/delete-versions/',
-        json=['0.1.0', '0.2.0', '0.3.0'],
-    )
+@dataclass
+class DeleteVersionsTestCase:
+    """Dataclass to hold delete-versions test case parameters."""
 
-    assert response.status_code == status.HTTP_200_OK
-    assert response.json() == ['0.1.0', '0.3.0']
+    versions: list[str]
+    backend_deleted_versions: set[str]
+    expected_json: list[str]
 
-    # Verify each call individually
-    assert mock_delete.await_count == 3
-    await_args_list = mock_delete.await_args_list
-    assert await_args_list[0] == mocker.call(project_name='testproj', version='0.1.0')
-    assert await_args_list[1] == mocker.call(project_name='testproj', version='0.2.0')
-    assert await_args_list[2] == mocker.call(project_name='testproj', version='0.3.0')
 
-    # Verify RBAC check
-    check_rbac_mock.assert_awaited_once_with(
-        rbac_input=ProjectRBACDecisionInput(
-            operation_type='delete',
-            project_name='testproj',
-            request=mocker.ANY,
+@pytest.mark.parametrize(
+    'test_case',
+    [
+        DeleteVersionsTestCase(
+            versions=['0.1.0', '0.2.0', '0.3.0'],
+            backend_deleted_versions={'0.1.0', '0.3.0'},
+            expected_json=['0.1.0', '0.3.0'],
         ),
-    )
-
-
-def test_delete_project_version_not_found(
-    fast_pypi_testclient: TestClient,
-    check_rbac_mock: AsyncMock,
+        # Versions the backend cannot find are left out of the response
+        DeleteVersionsTestCase(
+            versions=['0.1.0'],
+            backend_deleted_versions=set(),
+            expected_json=[],
+        ),
+        # Duplicate versions are deleted and reported once
+        DeleteVersionsTestCase(
+            versions=['0.1.0', '0.1.0'],
+            backend_deleted_versions={'0.1.0'},
+            expected_json=['0.1.0'],
+        ),
+    ],
+)
+async def test_delete_project_versions(
+    async_client: httpx.AsyncClient,
+    backend_stub: StubBackend,
+    check_rbac_mock: RBACRecorder,
     mocker: MockerFixture,
+    test_case: DeleteVersionsTestCase,
 ) -> None:
-    """Test deleting a non-existent project version."""
-    # Mock the backend to return not found
-    mock_backend = mocker.patch('fast_pypi.pypi.router.get_backend_from_env')
-    mock_backend.return_value.delete_project_version = mocker.AsyncMock(return_value=False)
+    """Test deleting project versions, including missing and duplicate ones."""
+    backend_stub.deleted_versions = test_case.backend_deleted_versions
 
-    response = fast_pypi_testclient.post('/fast-pypi/projects/testproj/delete-versions/', json=['0.1.0'])
+    response = await async_client.post(
+        '/fast-pypi/projects/testproj/delete-versions/',
+        json=test_case.versions,
+    )
 
     assert response.status_code == status.HTTP_200_OK
-    assert response.json() == []
+    assert response.json() == test_case.expected_json
+
+    # Deletes run concurrently, so compare the calls regardless of order
+    delete_calls = backend_stub.calls['delete_project_version']
+    assert len(delete_calls) == len(set(test_case.versions))
+    assert {(call['project_name'], call['version']) for call in delete_calls} == {
+        ('testproj', version) for version in test_case.versions
+    }
 
-    # Verify RBAC check still happened
-    check_rbac_mock.assert_awaited_once_with(
-        rbac_input=ProjectRBACDecisionInput(
+    # Verify RBAC check
+    assert check_rbac_mock.calls == [
+        ProjectRBACDecisionInput(
             operation_type='delete',
             project_name='testproj',
             request=mocker.ANY,
         ),
-    )
+    ]
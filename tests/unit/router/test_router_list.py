@@ -1,87 +1,87 @@
-from unittest.mock import AsyncMock
+from dataclasses import dataclass
 
+import httpx
+import pytest
 from fastapi import status
-from fastapi.testclient import TestClient
 from pytest_mock import MockerFixture
 
 from fast_pypi.pypi.package_rbac import ProjectRBACDecisionInput
+from tests.helpers import RBACRecorder, StubBackend
 
 
-def test_list_all_projects(
-    fast_pypi_testclient: TestClient,
-    check_rbac_mock: AsyncMock,
+async def test_list_all_projects(
+    async_client: httpx.AsyncClient,
+    backend_stub: StubBackend,
+    check_rbac_mock: RBACRecorder,
     mocker: MockerFixture,
 ) -> None:
     """Test listing all projects."""
     # Mock the backend to return a list of projects
-    mock_backend = mocker.patch('fast_pypi.pypi.router.get_backend_from_env')
-    mock_backend.return_value.list_projects = mocker.AsyncMock(
-        return_value=['project1', 'project2', 'project3'],
-    )
+    backend_stub.projects = ['project1', 'project2', 'project3']
 
-    response = fast_pypi_testclient.get('/fast-pypi/projects/')
+    response = await async_client.get('/fast-pypi/projects/')
 
     assert response.status_code == status.HTTP_200_OK
     assert response.json() == ['project1', 'project2', 'project3']
 
     # Verify RBAC check
-    check_rbac_mock.assert_awaited_once_with(
-        rbac_input=ProjectRBACDecisionInput(
+    assert check_rbac_mock.calls == [
+        ProjectRBACDecisionInput(
             operation_type='read',
             project_name=None,
             request=mocker.ANY,
         ),
-    )
+    ]
 
 
-def test_list_project_versions(
-    fast_pypi_testclient: TestClient,
-    check_rbac_mock: AsyncMock,
-    mocker: MockerFixture,
-) -> None:
-    """Test listing versions for a specific project."""
-    # Mock the backend to return list of versions
-    mock_backend = mocker.patch('fast_pypi.pypi.router.get_backend_from_env')
-    mock_backend.return_value.list_project_versions = mocker.AsyncMock(
-        return_value=['1.0.0', '2.0.0'],
-    )
+@dataclass
+class ListProjectVersionsTestCase:
+    """Dataclass to hold list-project-versions test case parameters."""
 
-    response = fast_pypi_testclient.get('/fast-pypi/projects/project1/versions/')
+    project_name: str
+    backend_versions: list[str]
+    expected_status_code: int
+    expected_json: list[str] | dict[str, str]
 
-    assert response.status_code == status.HTTP_200_OK
-    # The response should be a dict with versions list
-    assert response.json() == ['1.0.0', '2.0.0']
 
-    # Verify RBAC check
-    check_rbac_mock.assert_awaited_once_with(
-        rbac_input=ProjectRBACDecisionInput(
-            operation_type='read',
+@pytest.mark.parametrize(
+    'test_case',
+    [
+        ListProjectVersionsTestCase(
             project_name='project1',
-            request=mocker.ANY,
+            backend_versions=['1.0.0', '2.0.0'],
+            expected_status_code=status.HTTP_200_OK,
+            expected_json=['1.0.0', '2.0.0'],
         ),
-    )
-
-
-def test_list_project_versions_not_found(
-    fast_pypi_testclient: TestClient,
-    check_rbac_mock: AsyncMock,
+        # An empty version list means the project does not exist
+        ListProjectVersionsTestCase(
+            project_name='nonexistent',
+            backend_versions=[],
+            expected_status_code=status.HTTP_404_NOT_FOUND,
+            expected_json={'detail': 'Project nonexistent not found.'},
+        ),
+    ],
+)
+async def test_list_project_versions(
+    async_client: httpx.AsyncClient,
+    backend_stub: StubBackend,
+    check_rbac_mock: RBACRecorder,
     mocker: MockerFixture,
+    test_case: ListProjectVersionsTestCase,
 ) -> None:
-    """Test listing versions for a non-existent project."""
-    # Mock the backend to return empty list (project not found)
-    mock_backend = mocker.patch('fast_pypi.pypi.router.get_backend_from_env')
-    mock_backend.return_value.list_project_versions = mocker.AsyncMock(return_value=[])
+    """Test listing versions for a project, including one that does not exist."""
+    backend_stub.project_versions = test_case.backend_versions
 
-    response = fast_pypi_testclient.get('/fast-pypi/projects/nonexistent/versions/')
+    response = await async_client.get(f'/fast-pypi/projects/{test_case.project_name}/versions/')
 
-    assert response.status_code == status.HTTP_404_NOT_FOUND
-    assert response.json() == {'detail': 'Project nonexistent not found.'}
+    assert response.status_code == test_case.expected_status_code
+    assert response.json() == test_case.expected_json
 
-    # Verify RBAC check still happens even for non-existent projects
-    check_rbac_mock.assert_awaited_once_with(
-        rbac_input=ProjectRBACDecisionInput(
+    # Verify RBAC check happens even for non-existent projects
+    assert check_rbac_mock.calls == [
+        ProjectRBACDecisionInput(
             operation_type='read',
-            project_name='nonexistent',
+            project_name=test_case.project_name,
             request=mocker.ANY,
         ),
-    )
+    ]
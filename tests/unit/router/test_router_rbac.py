@@ -1,8 +1,10 @@
 from collections.abc import Iterator
 from dataclasses import dataclass
+from unittest.mock import AsyncMock
 
+import httpx
 import pytest
-from fastapi import FastAPI
+from fastapi import FastAPI, status
 from fastapi.responses import PlainTextResponse
 from fastapi.testclient import TestClient
 from pytest_mock import MockerFixture
@@ -15,8 +17,10 @@ from fast_pypi.pypi.package_rbac import (
 )
 
 
-@pytest.fixture
+@pytest.fixture(scope='session')
 def fast_pypi_rbac_test_app(fast_pypi_test_app: FastAPI) -> FastAPI:
+    """Fixture to register the RBAC test endpoints once on the shared app."""
+
     @fast_pypi_test_app.get(
         '/fast-pypi/rbac-test-read/',
         dependencies=[package_rbac_dependency('read')],
@@ -44,15 +48,33 @@ def fast_pypi_rbac_test_app(fast_pypi_test_app: FastAPI) -> FastAPI:
     return fast_pypi_test_app
 
 
-@pytest.fixture
+@pytest.fixture(scope='session')
 def fast_pypi_rbac_testclient(
     fast_pypi_rbac_test_app: FastAPI,
-) -> TestClient:
-    """Fixture to create a TestClient for the FastAPI app with RBAC endpoints."""
-    return TestClient(fast_pypi_rbac_test_app)
+) -> Iterator[TestClient]:
+    """Fixture to create a TestClient for the FastAPI app with RBAC endpoints.
+
+    Entering the client once keeps a single portal thread and lifespan for the whole session,
+    rather than starting a new portal for every request.
+    """
+    with TestClient(fast_pypi_rbac_test_app) as client:
+        yield client
 
 
-@dataclass
+@pytest.fixture(scope='module')
+def _module_infer_project_name_mock(module_mocker: MockerFixture) -> AsyncMock:
+    """Fixture patching project name inference once for the whole module."""
+    return module_mocker.patch('fast_pypi.pypi.package_rbac.infer_project_name_from_request')
+
+
+@pytest.fixture
+def infer_project_name_mock(_module_infer_project_name_mock: AsyncMock) -> AsyncMock:
+    """Fixture handing each test the module-wide inference mock with its results cleared."""
+    _module_infer_project_name_mock.reset_mock(return_value=True, side_effect=True)
+    return _module_infer_project_name_mock
+
+
+@dataclass(frozen=True, slots=True)
 class RBACTestCase:
     """Dataclass to hold RBAC test case parameters."""
 
@@ -63,44 +85,42 @@ class RBACTestCase:
     expected_status_code: int
 
 
-@pytest.mark.parametrize(
-    'test_case',
-    [
-        RBACTestCase(
-            method='GET',
-            path='/fast-pypi/rbac-test-read/',
-            request_headers={},
-            project_name='hotdog',
-            expected_status_code=200,
-        ),
-        RBACTestCase(
-            method='POST',
-            path='/fast-pypi/rbac-test-write/',
-            request_headers={},
-            project_name='hotdog',
-            expected_status_code=200,
-        ),
-        RBACTestCase(
-            method='DELETE',
-            path='/fast-pypi/rbac-test-delete/',
-            request_headers={},
-            project_name='hotdog',
-            expected_status_code=200,
-        ),
-    ],
+DEFAULT_RBAC_CASES = (
+    RBACTestCase(
+        method='GET',
+        path='/fast-pypi/rbac-test-read/',
+        request_headers={},
+        project_name='hotdog',
+        expected_status_code=200,
+    ),
+    RBACTestCase(
+        method='POST',
+        path='/fast-pypi/rbac-test-write/',
+        request_headers={},
+        project_name='hotdog',
+        expected_status_code=200,
+    ),
+    RBACTestCase(
+        method='DELETE',
+        path='/fast-pypi/rbac-test-delete/',
+        request_headers={},
+        project_name='hotdog',
+        expected_status_code=200,
+    ),
 )
-def test_rbac_default_noop(
+
+
+@pytest.mark.usefixtures('fast_pypi_rbac_test_app')
+@pytest.mark.parametrize('test_case', DEFAULT_RBAC_CASES, ids=lambda c: f'{c.method}-{c.expected_status_code}')
+async def test_rbac_default_noop(
     test_case: RBACTestCase,
-    fast_pypi_rbac_testclient: TestClient,
-    mocker: MockerFixture,
+    async_client: httpx.AsyncClient,
+    infer_project_name_mock: AsyncMock,
 ) -> None:
     """Test that the RBAC default noop works."""
-    _ = mocker.patch(
-        'fast_pypi.pypi.package_rbac.infer_project_name_from_request',
-        return_value=test_case.project_name,
-    )
+    infer_project_name_mock.return_value = test_case.project_name
 
-    response = fast_pypi_rbac_testclient.request(
+    response = await async_client.request(
         method=test_case.method,
         url=test_case.path,
     )
@@ -111,6 +131,19 @@ def test_rbac_default_noop(
     )
 
 
+def test_rbac_testclient_smoke(
+    fast_pypi_rbac_testclient: TestClient,
+    infer_project_name_mock: AsyncMock,
+) -> None:
+    """Smoke test the RBAC endpoints through a lifespan-running TestClient."""
+    infer_project_name_mock.return_value = 'hotdog'
+
+    response = fast_pypi_rbac_testclient.get('/fast-pypi/rbac-test-read/')
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.text == 'ok'
+
+
 async def package_rbac_test_func(
     rbac_input: ProjectRBACDecisionInput,
 ) -> bool:
@@ -142,79 +175,77 @@ def set_package_rbac_test_func() -> Iterator[None]:
     reset_project_rbac_decision_func()
 
 
-@pytest.mark.usefixtures('set_package_rbac_test_func')
-@pytest.mark.parametrize(
-    'test_case',
-    [
-        # Allowed cases - correct project, header, and allowed operations
-        RBACTestCase(
-            method='GET',
-            path='/fast-pypi/rbac-test-read/',
-            request_headers={'x-user-id': 'hotdog-vendor'},
-            project_name='hotdog',
-            expected_status_code=200,
-        ),
-        RBACTestCase(
-            method='POST',
-            path='/fast-pypi/rbac-test-write/',
-            request_headers={'x-user-id': 'hotdog-vendor'},
-            project_name='hotdog',
-            expected_status_code=200,
-        ),
-        # Wrong project name
-        RBACTestCase(
-            method='GET',
-            path='/fast-pypi/rbac-test-read/',
-            request_headers={'x-user-id': 'hotdog-vendor'},
-            project_name='pizza',
-            expected_status_code=403,
-        ),
-        # Missing required header
-        RBACTestCase(
-            method='GET',
-            path='/fast-pypi/rbac-test-read/',
-            request_headers={},
-            project_name='hotdog',
-            expected_status_code=403,
-        ),
-        # Wrong header value
-        RBACTestCase(
-            method='GET',
-            path='/fast-pypi/rbac-test-read/',
-            request_headers={'x-user-id': 'pizza-vendor'},
-            project_name='hotdog',
-            expected_status_code=403,
-        ),
-        # Delete operation not allowed even with correct project and header
-        RBACTestCase(
-            method='DELETE',
-            path='/fast-pypi/rbac-test-delete/',
-            request_headers={'x-user-id': 'hotdog-vendor'},
-            project_name='hotdog',
-            expected_status_code=403,
-        ),
-        # Multiple failures - wrong project and missing header
-        RBACTestCase(
-            method='GET',
-            path='/fast-pypi/rbac-test-read/',
-            request_headers={},
-            project_name='pizza',
-            expected_status_code=403,
-        ),
-        # Multiple failures - wrong project and wrong header
-        RBACTestCase(
-            method='POST',
-            path='/fast-pypi/rbac-test-write/',
-            request_headers={'x-user-id': 'pizza-vendor'},
-            project_name='pizza',
-            expected_status_code=403,
-        ),
-    ],
+CUSTOM_RBAC_CASES = (
+    # Allowed cases - correct project, header, and allowed operations
+    RBACTestCase(
+        method='GET',
+        path='/fast-pypi/rbac-test-read/',
+        request_headers={'x-user-id': 'hotdog-vendor'},
+        project_name='hotdog',
+        expected_status_code=200,
+    ),
+    RBACTestCase(
+        method='POST',
+        path='/fast-pypi/rbac-test-write/',
+        request_headers={'x-user-id': 'hotdog-vendor'},
+        project_name='hotdog',
+        expected_status_code=200,
+    ),
+    # Wrong project name
+    RBACTestCase(
+        method='GET',
+        path='/fast-pypi/rbac-test-read/',
+        request_headers={'x-user-id': 'hotdog-vendor'},
+        project_name='pizza',
+        expected_status_code=403,
+    ),
+    # Missing required header
+    RBACTestCase(
+        method='GET',
+        path='/fast-pypi/rbac-test-read/',
+        request_headers={},
+        project_name='hotdog',
+        expected_status_code=403,
+    ),
+    # Wrong header value
+    RBACTestCase(
+        method='GET',
+        path='/fast-pypi/rbac-test-read/',
+        request_headers={'x-user-id': 'pizza-vendor'},
+        project_name='hotdog',
+        expected_status_code=403,
+    ),
+    # Delete operation not allowed even with correct project and header
+    RBACTestCase(
+        method='DELETE',
+        path='/fast-pypi/rbac-test-delete/',
+        request_headers={'x-user-id': 'hotdog-vendor'},
+        project_name='hotdog',
+        expected_status_code=403,
+    ),
+    # Multiple failures - wrong project and missing header
+    RBACTestCase(
+        method='GET',
+        path='/fast-pypi/rbac-test-read/',
+        request_headers={},
+        project_name='pizza',
+        expected_status_code=403,
+    ),
+    # Multiple failures - wrong project and wrong header
+    RBACTestCase(
+        method='POST',
+        path='/fast-pypi/rbac-test-write/',
+        request_headers={'x-user-id': 'pizza-vendor'},
+        project_name='pizza',
+        expected_status_code=403,
+    ),
 )
-def test_rbac_custom_function(
-    test_case: RBACTestCase,
-    fast_pypi_rbac_testclient: TestClient,
-    mocker: MockerFixture,
+
+
+@pytest.mark.usefixtures('fast_pypi_rbac_test_app', 'set_package_rbac_test_func')
+async def test_rbac_custom_function(
+    async_client: httpx.AsyncClient,
+    infer_project_name_mock: AsyncMock,
 ) -> None:
     """Test that the custom RBAC function enforces all rules correctly.
 
@@ -222,19 +253,25 @@ def test_rbac_custom_function(
     - Project name must be 'hotdog'
     - Header 'x-user-id' must be 'hotdog-vendor'
     - Only 'read' and 'write' operations are allowed
+
+    All cases run in one test so the patching and fixture setup are paid once. Mismatches are
+    collected and reported together.
     """
-    _ = mocker.patch(
-        'fast_pypi.pypi.package_rbac.infer_project_name_from_request',
-        return_value=test_case.project_name,
-    )
+    infer_project_name_mock.side_effect = [test_case.project_name for test_case in CUSTOM_RBAC_CASES]
 
-    response = fast_pypi_rbac_testclient.request(
-        method=test_case.method,
-        url=test_case.path,
-        headers=test_case.request_headers,
-    )
+    mismatches: list[str] = []
+    for idx, test_case in enumerate(CUSTOM_RBAC_CASES):
+        response = await async_client.request(
+            method=test_case.method,
+            url=test_case.path,
+            headers=test_case.request_headers,
+        )
+        if response.status_code != test_case.expected_status_code:
+            mismatches.append(
+                (
+                    f'case {idx}: expected status code {test_case.expected_status_code}, '
+                    f'but got {response.status_code} for {test_case.method} {test_case.path}'
+                ),
+            )
 
-    assert response.status_code == test_case.expected_status_code, (
-        f'Expected status code {test_case.expected_status_code}, '
-        f'but got {response.status_code} for {test_case.method} {test_case.path}'
-    )
+    assert not mismatches, '\n'.join(mismatches)
@@ -1,102 +1,90 @@
-from io import BytesIO
-from unittest.mock import ANY, AsyncMock
-
-import pytest
+import httpx
 from fastapi import status
-from fastapi.testclient import TestClient
 from pytest_mock import MockerFixture
 
 from fast_pypi.backends import ProjectFileExistsError
 from fast_pypi.pypi.package_rbac import ProjectRBACDecisionInput
+from tests.helpers import RBACRecorder, StubBackend
 
+UPLOAD_FORM_DATA = {
+    ':action': 'file_upload',
+    'protocol_version': '1',
+    'metadata_version': '2.1',
+    'name': 'testproj',
+    'version': '0.1.0',
+    'filetype': 'bdist_wheel',
+    'description': 'A test project',
+    'description_content_type': 'text/markdown',
+}
+UPLOAD_FILE_CONTENT = b'fake wheel content'
 
-@pytest.fixture
-def upload_form_data() -> dict[str, str]:
-    """Fixture to provide test upload form data."""
-    return {
-        ':action': 'file_upload',
-        'protocol_version': '1',
-        'metadata_version': '2.1',
-        'name': 'testproj',
-        'version': '0.1.0',
-        'filetype': 'bdist_wheel',
-        'description': 'A test project',
-        'description_content_type': 'text/markdown',
-    }
+# The upload payload is fixed, so encode the multipart body once at import and post the raw bytes
+_upload_request = httpx.Request(
+    'POST',
+    'http://testserver/fast-pypi/upload/',
+    data=UPLOAD_FORM_DATA,
+    files={'content': ('testproj-0.1.0-py3-none-any.whl', UPLOAD_FILE_CONTENT)},
+)
+UPLOAD_BODY = _upload_request.read()
+UPLOAD_HEADERS = {'Content-Type': _upload_request.headers['Content-Type']}
 
 
-def test_upload_project_file(
-    fast_pypi_testclient: TestClient,
-    check_rbac_mock: AsyncMock,
-    upload_form_data: dict[str, str],
+async def test_upload_project_file(
+    async_client: httpx.AsyncClient,
+    backend_stub: StubBackend,
+    check_rbac_mock: RBACRecorder,
     mocker: MockerFixture,
 ) -> None:
     """Test uploading a project file."""
-    # Mock the backend
-    mock_backend = mocker.patch('fast_pypi.pypi.router.get_backend_from_env')
-    mock_backend.return_value.upload_file = mocker.AsyncMock()
-
-    files = {
-        'content': (
-            'testproj-0.1.0-py3-none-any.whl',
-            BytesIO(b'fake wheel content'),
-        ),
-    }
-    response = fast_pypi_testclient.post(
+    response = await async_client.post(
         '/fast-pypi/upload/',
-        files=files,
-        data=upload_form_data,
+        content=UPLOAD_BODY,
+        headers=UPLOAD_HEADERS,
     )
 
     assert response.status_code == status.HTTP_201_CREATED
 
     # Verify backend call
-    mock_backend.return_value.upload_file.assert_awaited_once_with(
-        project_name='testproj',
-        version='0.1.0',
-        filename='testproj-0.1.0-py3-none-any.whl',
-        file_content=ANY,  # Can't easily compare bytes objects
-        sha256_digest=None,
-    )
+    assert backend_stub.calls['upload_file'] == [
+        {
+            'project_name': 'testproj',
+            'version': '0.1.0',
+            'filename': 'testproj-0.1.0-py3-none-any.whl',
+            'file_content': UPLOAD_FILE_CONTENT,
+            'sha256_digest': None,
+        },
+    ]
 
     # Verify RBAC check
-    check_rbac_mock.assert_awaited_once_with(
-        rbac_input=ProjectRBACDecisionInput(
+    assert check_rbac_mock.calls == [
+        ProjectRBACDecisionInput(
             operation_type='write',
             project_name='testproj',
             request=mocker.ANY,
         ),
-    )
+    ]
 
 
-def test_upload_project_file_exists(
-    fast_pypi_testclient: TestClient,
-    check_rbac_mock: AsyncMock,
-    upload_form_data: dict[str, str],
-    mocker: MockerFixture,
+async def test_upload_project_file_exists(
+    async_client: httpx.AsyncClient,
+    backend_stub: StubBackend,
+    check_rbac_mock: RBACRecorder,
 ) -> None:
     """Test uploading a file that already exists."""
     # Mock the backend to raise ProjectFileExistsError
-    mock_backend = mocker.patch('fast_pypi.pypi.router.get_backend_from_env')
-    mock_backend.return_value.upload_file.side_effect = ProjectFileExistsError(
+    backend_stub.upload_error = ProjectFileExistsError(
         filename='testproj-0.1.0-py3-none-any.whl',
         project_name='testproj',
     )
 
-    files = {
-        'content': (
-            'testproj-0.1.0-py3-none-any.whl',
-            BytesIO(b'fake wheel content'),
-        ),
-    }
-    response = fast_pypi_testclient.post(
+    response = await async_client.post(
         '/fast-pypi/upload/',
-        files=files,
-        data=upload_form_data,
+        content=UPLOAD_BODY,
+        headers=UPLOAD_HEADERS,
     )
 
     assert response.status_code == status.HTTP_409_CONFLICT
     assert response.json()['detail'] == 'File testproj-0.1.0-py3-none-any.whl for project testproj already exists.'
 
     # Verify RBAC check still happened
-    check_rbac_mock.assert_awaited_once()
+    assert len(check_rbac_mock.calls) == 1
@@ -1,36 +1,38 @@
-from unittest.mock import AsyncMock, MagicMock
+from dataclasses import dataclass, field
+from typing import cast
 
 import pytest
 from fastapi import Request
 from starlette.datastructures import URL
 
-from fast_pypi.pypi.utils import infer_project_name_from_request
+from fast_pypi.pypi.utils import infer_project_name_from_path, infer_project_name_from_request
 
 
-@pytest.fixture
-def mock_request() -> MagicMock:
-    """Create a mock request with a configurable URL."""
-    request = MagicMock(spec=Request)
+@dataclass
+class FakeRequest:
+    """Minimal stand-in for a Starlette request exposing only what project name inference reads."""
 
-    # These can be overridden in tests
-    request.url = URL('')
-    request.form = AsyncMock(side_effect=lambda: None)
+    method: str
+    url: URL
+    form_data: dict[str, str] | type[Exception] = field(default_factory=dict)
 
-    return request
+    async def form(self) -> dict[str, str]:
+        """Return the configured form data, or raise the configured exception."""
+        if isinstance(self.form_data, dict):
+            return self.form_data
+        raise self.form_data
 
 
-@pytest.fixture
-def mock_form_request(mock_request: Request) -> Request:
-    """Create a mock request that returns form data."""
-
-    async def mock_form() -> dict[str, str]:
-        return {'name': 'test-project'}
-
-    mock_request.form = AsyncMock(side_effect=mock_form)
-    return mock_request
+def fake_request(
+    method: str,
+    path: str,
+    form_data: dict[str, str] | type[Exception] | None = None,
+) -> Request:
+    """Build a FakeRequest typed as the Request that project name inference expects."""
+    request = FakeRequest(method=method, url=URL(path), form_data=form_data or {})
+    return cast('Request', cast('object', request))
 
 
-@pytest.mark.asyncio
 @pytest.mark.parametrize(
     'path_prefix',
     ['', '/prefix', '/prefix/sub'],
@@ -52,35 +54,32 @@ def mock_form_request(mock_request: Request) -> Request:
         ('POST', '/projects/test-project/delete-versions/', 'test-project'),
     ],
 )
-async def test_infer_project_name_from_path(
-    mock_request: MagicMock,
+def test_infer_project_name_from_path(
     method: str,
     path_prefix: str,
     path: str,
     expected_name: str | None,
 ) -> None:
     """Test project name inference from various URL paths."""
-    mock_request.method = method
-    mock_request.url = URL(f'{path_prefix}{path}')
+    assert infer_project_name_from_path(method, f'{path_prefix}{path}') == expected_name
 
-    result = await infer_project_name_from_request(mock_request)
-    assert result == expected_name
 
+async def test_infer_project_name_from_request_path() -> None:
+    """Test that non-upload requests infer the project name from their URL path."""
+    request = fake_request('GET', '/prefix/simple/test-project/')
 
-@pytest.mark.asyncio
-async def test_infer_project_name_from_upload_form(
-    mock_form_request: MagicMock,
-) -> None:
+    result = await infer_project_name_from_request(request)
+    assert result == 'test-project'
+
+
+async def test_infer_project_name_from_upload_form() -> None:
     """Test project name inference from upload form data."""
-    mock_form_request.method = 'POST'
-    mock_form_request.url = URL('/upload/')
-    # Don't override form here, it's already set in the fixture
+    request = fake_request('POST', '/upload/', form_data={'name': 'test-project'})
 
-    result = await infer_project_name_from_request(mock_form_request)
+    result = await infer_project_name_from_request(request)
     assert result == 'test-project'
 
 
-@pytest.mark.asyncio
 @pytest.mark.parametrize(
     'path',
     [
@@ -90,23 +89,15 @@ async def test_infer_project_name_from_upload_form(
     ],
 )
 async def test_infer_project_name_from_upload_form_missing(
-    mock_request: MagicMock,
     path: str,
 ) -> None:
     """Test upload form handling when form data is missing or invalid."""
-    mock_request.method = 'POST'
-    mock_request.url = URL(path)
-
-    # Mock form() to return empty data
-    async def mock_form() -> dict[str, str]:
-        return {}
+    request = fake_request('POST', path)
 
-    mock_request.form = AsyncMock(side_effect=mock_form)
-    result = await infer_project_name_from_request(mock_request)
+    result = await infer_project_name_from_request(request)
     assert result is None
 
 
-@pytest.mark.asyncio
 @pytest.mark.parametrize(
     'path',
     [
@@ -116,19 +107,16 @@ async def test_infer_project_name_from_upload_form_missing(
     ],
 )
 async def test_infer_project_name_from_upload_form_error(
-    mock_request: MagicMock,
     path: str,
 ) -> None:
     """Test upload form handling when form() raises RuntimeError."""
-    mock_request.method = 'POST'
-    mock_request.url = URL(path)
-    # Mock form() to raise RuntimeError (e.g. already consumed)
-    mock_request.form = AsyncMock(side_effect=RuntimeError)
-    result = await infer_project_name_from_request(mock_request)
+    # form() raising RuntimeError mimics a body that was already consumed
+    request = fake_request('POST', path, form_data=RuntimeError)
+
+    result = await infer_project_name_from_request(request)
     assert result is None
 
 
-@pytest.mark.asyncio
 @pytest.mark.parametrize(
     'path_prefix',
     ['', '/prefix', '/prefix/sub'],
@@ -157,15 +145,11 @@ async def test_infer_project_name_from_upload_form_error(
         ('DELETE', '/delete/test-project'),
     ],
 )
-async def test_infer_project_name_from_invalid_paths(
-    mock_request: MagicMock,
+def test_infer_project_name_from_invalid_paths(
     method: str,
     path_prefix: str,
     path: str,
 ) -> None:
-    """Test project name inference returns None for invalid paths and methods."""
-    mock_request.method = method
-    mock_request.url = URL(f'{path_prefix}{path}')
-
+    """Test project name inference raises for invalid paths and methods."""
     with pytest.raises(ValueError, match='Unable to infer project name from request'):
-        _ = await infer_project_name_from_request(mock_request)
+        _ = infer_project_name_from_path(method, f'{path_prefix}{path}')
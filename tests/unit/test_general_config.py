@@ -1,21 +1,66 @@
+import os
+
 import pytest
+from pydantic import ValidationError
 
 from fast_pypi.config import FastPypiConfig
 
 
-def test_get_backend_allow_overwrite_true(
-    monkeypatch: pytest.MonkeyPatch,
-) -> None:
-    """Test that allow_overwrite flag is passed correctly when true."""
-    monkeypatch.setenv('FAST_PYPI_ALLOW_OVERWRITE', 'true')
+def test_config_defaults() -> None:
+    """Test the defaults used when a setting is not provided."""
+    config = FastPypiConfig()
+    assert config.allow_overwrite is False
+    assert config.backend == 'localfs'
+
+
+@pytest.mark.parametrize(
+    ('raw', 'expected'),
+    [
+        pytest.param('true', True, id='true'),
+        pytest.param('TRUE', True, id='upper-true'),
+        pytest.param(' True ', True, id='padded-true'),
+        pytest.param('1', True, id='one'),
+        pytest.param('yes', True, id='yes'),
+        pytest.param('false', False, id='false'),
+        pytest.param('0', False, id='zero'),
+        pytest.param('no', False, id='no'),
+        pytest.param('maybe', False, id='unrecognized'),
+        pytest.param('', False, id='empty'),
+    ],
+)
+def test_from_env_allow_overwrite(raw: str, *, expected: bool) -> None:
+    """Test that FAST_PYPI_ALLOW_OVERWRITE is parsed from the environment."""
+    os.environ['FAST_PYPI_ALLOW_OVERWRITE'] = raw
+    assert FastPypiConfig.from_env().allow_overwrite is expected
+
+
+def test_all_settings_from_env() -> None:
+    """Test that every setting is read from a single environment in one from_env call."""
+    os.environ['FAST_PYPI_ALLOW_OVERWRITE'] = 'true'
+    os.environ['FAST_PYPI_BACKEND'] = 'azure_blob'
     config = FastPypiConfig.from_env()
     assert config.allow_overwrite is True
+    assert config.backend == 'azure_blob'
 
 
-def test_get_backend_allow_overwrite_false(
-    monkeypatch: pytest.MonkeyPatch,
-) -> None:
-    """Test that allow_overwrite flag is passed correctly when false."""
-    monkeypatch.setenv('FAST_PYPI_ALLOW_OVERWRITE', 'false')
+def test_from_env_defaults() -> None:
+    """Test that from_env falls back to the defaults when no FAST_PYPI_* variables are set."""
+    assert FastPypiConfig.from_env() == FastPypiConfig()
+
+
+def test_from_env_caches_by_env_values() -> None:
+    """Test that from_env reuses parsed configs per environment and re-parses when it changes."""
+    os.environ['FAST_PYPI_ALLOW_OVERWRITE'] = 'true'
+    first = FastPypiConfig.from_env()
+    assert FastPypiConfig.from_env() is first
+
+    os.environ['FAST_PYPI_ALLOW_OVERWRITE'] = 'false'
+    assert FastPypiConfig.from_env().allow_overwrite is False
+
+
+def test_from_env_config_is_frozen() -> None:
+    """Test that the cached config shared by from_env callers cannot be mutated."""
     config = FastPypiConfig.from_env()
-    assert config.allow_overwrite is False
+    with pytest.raises(ValidationError):
+        config.allow_overwrite = True
+    assert FastPypiConfig.from_env().allow_overwrite is False